@@ -4,25 +4,89 @@ CloudTask CLI - Task Management with Cloud Sync
 """
 
 import argparse
+import functools
 import json
 import os
 import re
 import sys
 import time
-import shutil
-import importlib.metadata
 from datetime import datetime, timedelta
-from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
-from concurrent.futures import ThreadPoolExecutor
-from urllib.parse import quote_plus
-import subprocess
 
-try:
-    import requests
-except ImportError:
-    print("Error: 'requests' library required. Install with: pip install requests")
-    sys.exit(1)
+# 'requests' is imported on first API use so that commands which never touch
+# the network don't pay for loading it (see _lazy_requests)
+_requests = None
+
+
+def _lazy_requests():
+    """Import and return the 'requests' module on first use"""
+    global _requests
+    if _requests is None:
+        try:
+            import requests
+        except ImportError:
+            print("Error: 'requests' library required. Install with: pip install requests")
+            sys.exit(1)
+        _requests = requests
+    return _requests
+
+
+def _lazy_httpx():
+    """Import and return the optional 'httpx' module, or None if unavailable"""
+    try:
+        import httpx
+    except ImportError:
+        return None
+    return httpx
+
+
+def __getattr__(name: str):
+    """Resolve 'cloudtask.requests' lazily for external callers"""
+    if name == "requests":
+        return _lazy_requests()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# JSON codec: orjson when installed, else the stdlib. Resolved on first use so
+# commands that never touch JSON don't pay for importing orjson.
+# Both codecs already share one str object per repeated object key (orjson's
+# key cache, the stdlib C scanner's per-document memo), so task rows parsed
+# from the cache or an API response need no extra key interning.
+_json_codec = None
+
+
+def _get_json_codec() -> Tuple[Any, Any, bool]:
+    """Return (loads, dumps, loads_accepts_buffer) for the active codec"""
+    global _json_codec
+    if _json_codec is None:
+        try:
+            import orjson
+            
+            def dumps(obj: Any, indent: bool = True) -> bytes:
+                return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+            
+            # orjson parses memoryviews without copying
+            _json_codec = (orjson.loads, dumps, True)
+        except ImportError:
+            # Fallback to the stdlib codec
+            def dumps(obj: Any, indent: bool = True) -> bytes:
+                if indent:
+                    return json.dumps(obj, indent=2).encode()
+                return json.dumps(obj, separators=(",", ":")).encode()
+            
+            _json_codec = (json.loads, dumps, False)
+    return _json_codec
+
+
+def _json_loads(data) -> Any:
+    """Decode JSON from bytes, str or (with orjson) a buffer"""
+    return _get_json_codec()[0](data)
+
+
+def _json_dumps(obj: Any, indent: bool = True) -> bytes:
+    """Encode obj as UTF-8 JSON, indented unless indent is False"""
+    return _get_json_codec()[1](obj, indent)
+
 
 try:
     import xdg
@@ -41,15 +105,19 @@ except ImportError:
 APP_NAME = "cloudtask"
 VERSION = "1.0.0"
 
+# Directories are created on first write, not on every startup
 for key in DIRS.keys():
-    DIRS[key] = path = os.path.join(DIRS[key], APP_NAME)
-    if not os.path.exists(path):
-        os.makedirs(path, exist_ok=True)
+    DIRS[key] = os.path.join(DIRS[key], APP_NAME)
 
 API_KEY_FILE = os.path.join(DIRS['config'], "api_key")
 CONFIG_FILE = os.path.join(DIRS['config'], "config.json")
 CACHE_FILE = os.path.join(DIRS['cache'], "task_cache.json")
+RESPONSE_CACHE_DIR = os.path.join(DIRS['cache'], "responses")
 CACHE_DURATION = timedelta(minutes=15)
+# Cache files larger than this are parsed straight from an mmap
+CACHE_MMAP_THRESHOLD = 64 * 1024
+# Server responses meaning the bulk update endpoint isn't available
+BULK_UNSUPPORTED_STATUSES = (404, 405, 501)
 
 # Default API endpoint
 API_BASE_URL = os.getenv("CLOUDTASK_URL", "https://api.cloudtask.io")
@@ -61,7 +129,9 @@ API_BASE_URL = os.getenv("CLOUDTASK_URL", "https://api.cloudtask.io")
 
 class CloudTaskException(Exception):
     """Base exception for CloudTask CLI"""
-    pass
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
 
 
 class argument:
@@ -93,6 +163,126 @@ class CustomHelpFormatter(argparse.RawTextHelpFormatter):
         super().__init__(prog, width=120, max_help_position=45, indent_increment=2)
 
 
+class LazySubParsersAction(argparse._SubParsersAction):
+    """
+    Subparsers action that builds each command's parser on first lookup.
+
+    Commands are registered as thunks; only the parser for the command being
+    run is materialized, while help output still lists every command.
+    """
+
+    class _LazyParserMap(dict):
+        """Name -> parser map that materializes pending commands on access"""
+        def __init__(self, action):
+            super().__init__()
+            self.action = action
+
+        def __missing__(self, name):
+            self.action._materialize(name)
+            return dict.__getitem__(self, name)
+
+        def __contains__(self, name):
+            return dict.__contains__(self, name) or name in self.action._pending
+
+        def __iter__(self):
+            yield from dict.__iter__(self)
+            yield from (name for name in self.action._pending
+                        if not dict.__contains__(self, name))
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending = {}
+        self._name_parser_map = self.choices = self._LazyParserMap(self)
+
+    def add_lazy_parser(self, name: str, aliases, help: Optional[str], build):
+        """Register a command whose parser is created by build() when needed"""
+        entry = (name, aliases, build)
+        for key in [name, *aliases]:
+            self._pending[key] = entry
+        self._choices_actions.append(self._ChoicesPseudoAction(name, aliases, help))
+
+    def _materialize(self, name: str):
+        """Build the parser registered under name (raises KeyError if unknown)"""
+        name, aliases, build = self._pending[name]
+        for key in [name, *aliases]:
+            self._pending.pop(key, None)
+        build()
+
+
+class ArgSpec:
+    """Lightweight description of an argument used by the fast parse path"""
+    SUPPORTED_ACTIONS = ("store", "store_true", "store_false")
+    
+    def __init__(self, args: Tuple[str, ...], kwargs: Dict,
+                 mutex_group: Optional[str] = None):
+        self.option_strings = [a for a in args if a.startswith("-")]
+        self.action = kwargs.get("action", "store")
+        self.type = kwargs.get("type")
+        self.nargs = kwargs.get("nargs")
+        self.choices = kwargs.get("choices")
+        self.required = kwargs.get("required", False)
+        self.mutex_group = mutex_group
+        
+        if self.option_strings:
+            long_opts = [o for o in self.option_strings if o.startswith("--")]
+            dest = (long_opts or self.option_strings)[0].lstrip("-").replace("-", "_")
+        else:
+            dest = args[0]
+        self.dest = kwargs.get("dest", dest)
+        
+        if "default" in kwargs:
+            self.default = kwargs["default"]
+        else:
+            self.default = self.action == "store_false" if self.action != "store" else None
+        # argparse converts string defaults with the argument's type
+        if isinstance(self.default, str) and self.type:
+            self.default = self.type(self.default)
+    
+    def convert(self, value: str) -> Any:
+        """Apply type conversion and choices check (raises ValueError on failure)"""
+        if self.type:
+            try:
+                value = self.type(value)
+            except (TypeError, argparse.ArgumentTypeError) as e:
+                raise ValueError(str(e))
+        if self.choices is not None and value not in self.choices:
+            raise ValueError(f"invalid choice: {value!r}")
+        return value
+
+
+class CommandSpec:
+    """Registered command with the argument specs needed for fast parsing"""
+    def __init__(self, name: str, func, arguments: Tuple[argument, ...], globals_start: int):
+        self.name = name
+        self.func = func
+        self.globals_start = globals_start
+        self.positionals = []
+        self.options = {}
+        self.supported = True
+        for arg in arguments:
+            self.add(ArgSpec(arg.args, arg.kwargs, arg.mutex_group))
+    
+    def add(self, spec: ArgSpec):
+        """Index an argument spec by its option strings"""
+        if spec.action not in ArgSpec.SUPPORTED_ACTIONS:
+            self.supported = False
+        # Multi-value options are left to argparse
+        if spec.option_strings and spec.nargs is not None:
+            self.supported = False
+        if spec.option_strings:
+            for option in spec.option_strings:
+                self.options.setdefault(option, spec)
+        else:
+            self.positionals.append(spec)
+    
+    def specs(self) -> List[ArgSpec]:
+        """All distinct argument specs, positionals first"""
+        seen = {}
+        for spec in self.positionals + list(self.options.values()):
+            seen[id(spec)] = spec
+        return list(seen.values())
+
+
 class CommandParserWrapper:
     """
     Argument parser wrapper enabling decorator-based command registration.
@@ -106,9 +296,13 @@ class CommandParserWrapper:
         self.parser.set_defaults(func=self._fail_with_help)
         self.subparsers_ = None
         self.subparser_objs = []
+        self.global_arguments = []
+        self.top_level_spec = CommandSpec("", None, (), 0)
+        self.command_specs = {}
         self.post_setup_hooks = []
         self.verbs = set()
         self.objects = set()
+        self.verb_objects = {}
 
     def _fail_with_help(self, *args, **kwargs):
         """Default handler that prints help when no command specified"""
@@ -118,27 +312,34 @@ class CommandParserWrapper:
     def add_argument(self, *args, **kwargs):
         """Add global argument available to all subcommands"""
         parent_only = kwargs.pop("parent_only", False)
+        self.top_level_spec.add(ArgSpec(args, kwargs))
         
         if not parent_only:
+            self.global_arguments.append((args, kwargs.copy()))
             for subparser in self.subparser_objs:
-                try:
-                    if not hasattr(subparser, '_global_options_group'):
-                        subparser._global_options_group = subparser.add_argument_group(
-                            'Global options (available for all commands)'
-                        )
-                    subparser_kwargs = kwargs.copy()
-                    subparser_kwargs['default'] = argparse.SUPPRESS
-                    subparser._global_options_group.add_argument(*args, **subparser_kwargs)
-                except argparse.ArgumentError:
-                    pass  # Argument already exists
+                self._add_global_argument(subparser, args, kwargs)
         
         return self.parser.add_argument(*args, **kwargs)
 
+    def _add_global_argument(self, subparser: argparse.ArgumentParser, args, kwargs):
+        """Propagate a global argument to a command's subparser"""
+        try:
+            if not hasattr(subparser, '_global_options_group'):
+                subparser._global_options_group = subparser.add_argument_group(
+                    'Global options (available for all commands)'
+                )
+            subparser_kwargs = kwargs.copy()
+            subparser_kwargs['default'] = argparse.SUPPRESS
+            subparser._global_options_group.add_argument(*args, **subparser_kwargs)
+        except argparse.ArgumentError:
+            pass  # Argument already exists
+
     def subparsers(self, *args, **kwargs):
         """Get or create subparsers for commands"""
         if self.subparsers_ is None:
             kwargs["metavar"] = "command"
             kwargs["help"] = "command to run"
+            kwargs["action"] = LazySubParsersAction
             self.subparsers_ = self.parser.add_subparsers(*args, **kwargs)
         return self.subparsers_
 
@@ -147,6 +348,7 @@ class CommandParserWrapper:
         if obj:
             self.verbs.add(verb)
             self.objects.add(obj)
+            self.verb_objects.setdefault(verb, set()).add(obj)
             return f"{verb} {obj}"
         else:
             self.objects.add(verb)
@@ -182,16 +384,29 @@ class CommandParserWrapper:
             if "formatter_class" not in kwargs:
                 kwargs["formatter_class"] = CustomHelpFormatter
             
-            subparser = self.subparsers().add_parser(
-                name, 
-                aliases=aliases_transformed, 
-                help=help_text, 
-                **kwargs
-            )
+            # Only global arguments added after registration are propagated
+            globals_start = len(self.global_arguments)
+            group_plan = self._plan_argument_groups(arguments)
+            
+            def build():
+                subparser = self.subparsers().add_parser(
+                    name, 
+                    aliases=aliases_transformed, 
+                    **kwargs
+                )
+                
+                self.subparser_objs.append(subparser)
+                self._process_arguments_with_groups(subparser, group_plan)
+                for global_args, global_kwargs in self.global_arguments[globals_start:]:
+                    self._add_global_argument(subparser, global_args, global_kwargs)
+                subparser.set_defaults(func=func)
             
-            self.subparser_objs.append(subparser)
-            self._process_arguments_with_groups(subparser, arguments)
-            subparser.set_defaults(func=func)
+            # Defer building the subparser until the command is looked up
+            self.subparsers().add_lazy_parser(name, aliases_transformed, help_text, build)
+            
+            spec = CommandSpec(name, func, arguments, globals_start)
+            for key in [name, *aliases_transformed]:
+                self.command_specs[key] = spec
             
             return func
         
@@ -203,48 +418,67 @@ class CommandParserWrapper:
         
         return decorator
 
-    def _process_arguments_with_groups(self, parser_obj: argparse.ArgumentParser, 
-                                      arguments: Tuple[argument, ...]):
-        """Process arguments and handle mutually exclusive groups"""
-        mutex_groups_to_required = {}
-        arg_to_group = {}
+    @staticmethod
+    def _plan_argument_groups(arguments: Tuple[argument, ...]):
+        """
+        Work out mutually exclusive groups once, at registration time.
+        
+        Returns (groups, layout): groups maps group name -> required, and
+        layout lists (group_name or None, args, kwargs) in declaration order.
+        """
+        groups = {}
+        layout = []
         
         # Determine mutex groups and their required status
         for arg in arguments:
-            key = arg.args[0]
+            kwargs = arg.kwargs
             if arg.mutex_group:
-                is_required = arg.kwargs.pop('required', False)
-                group_name = arg.mutex_group
-                arg_to_group[key] = group_name
-                if not mutex_groups_to_required.get(group_name):
-                    mutex_groups_to_required[group_name] = is_required
+                kwargs = dict(kwargs)
+                is_required = kwargs.pop('required', False)
+                groups[arg.mutex_group] = groups.get(arg.mutex_group) or is_required
+            layout.append((arg.mutex_group, arg.args, kwargs))
+        
+        return groups, layout
+
+    def _process_arguments_with_groups(self, parser_obj: argparse.ArgumentParser, plan):
+        """Add arguments from a _plan_argument_groups() plan to a parser"""
+        groups, layout = plan
         
         # Create mutex group parsers
-        name_to_group_parser = {}
-        for group_name, is_required in mutex_groups_to_required.items():
-            mutex_group = parser_obj.add_mutually_exclusive_group(required=is_required)
-            name_to_group_parser[group_name] = mutex_group
+        name_to_group_parser = {
+            group_name: parser_obj.add_mutually_exclusive_group(required=is_required)
+            for group_name, is_required in groups.items()
+        }
         
         # Add arguments to appropriate parser
-        for arg in arguments:
-            key = arg.args[0]
-            target_parser = name_to_group_parser.get(arg_to_group.get(key), parser_obj)
-            target_parser.add_argument(*arg.args, **arg.kwargs)
+        for group_name, args, kwargs in layout:
+            target_parser = name_to_group_parser.get(group_name, parser_obj)
+            target_parser.add_argument(*args, **kwargs)
 
     def parse_args(self, argv: Optional[List[str]] = None, *args, **kwargs):
         """Parse command line arguments with special handling for multi-word commands"""
         if argv is None:
             argv = sys.argv[1:]
         
-        # Handle multi-word commands (e.g., "create task" -> "create task")
+        # Handle multi-word commands (e.g., "create task" -> "create task"),
+        # joining only verb + object pairs that were actually registered
         argv_processed = []
-        for token in argv:
-            if argv_processed and argv_processed[-1] in self.verbs:
-                argv_processed[-1] += " " + token
+        idx = 0
+        while idx < len(argv):
+            token = argv[idx]
+            objects = self.verb_objects.get(token)
+            if objects and idx + 1 < len(argv) and argv[idx + 1] in objects:
+                argv_processed.append(f"{token} {argv[idx + 1]}")
+                idx += 2
             else:
                 argv_processed.append(token)
+                idx += 1
         
-        args_parsed = self.parser.parse_args(argv_processed, *args, **kwargs)
+        args_parsed = None
+        if not args and not kwargs:
+            args_parsed = self._parse_args_fast(argv_processed)
+        if args_parsed is None:
+            args_parsed = self.parser.parse_args(argv_processed, *args, **kwargs)
         
         # Run post-setup hooks
         for hook in self.post_setup_hooks:
@@ -252,37 +486,232 @@ class CommandParserWrapper:
         
         return args_parsed
 
+    def _parse_args_fast(self, argv: List[str]) -> Optional[argparse.Namespace]:
+        """
+        Parse argv without argparse for the common, well-formed case.
+        
+        Returns None whenever the input needs anything beyond plain options and
+        contiguous positionals (help, abbreviations, errors, ...), so the caller
+        can fall back to argparse for identical behavior and error messages.
+        """
+        spec = self.top_level_spec
+        if not spec.supported:
+            return None
+        command = None
+        values = {}
+        given = []
+        positionals = []
+        positionals_closed = False
+        
+        idx = 0
+        while idx < len(argv):
+            token = argv[idx]
+            idx += 1
+            
+            if token in ("-h", "--help", "--"):
+                return None
+            
+            if not token.startswith("-") or token == "-":
+                if command is None:
+                    command = self.command_specs.get(token)
+                    if command is None or not command.supported:
+                        return None
+                    spec = CommandSpec(command.name, command.func, (), 0)
+                    for arg_spec in command.specs():
+                        spec.add(arg_spec)
+                    for global_args, global_kwargs in self.global_arguments[command.globals_start:]:
+                        global_kwargs = dict(global_kwargs, default=argparse.SUPPRESS)
+                        spec.add(ArgSpec(global_args, global_kwargs))
+                    if not spec.supported:
+                        return None
+                    continue
+                if positionals_closed:
+                    return None
+                positionals.append(token)
+                continue
+            
+            if positionals:
+                positionals_closed = True
+            
+            option, has_value, value = token.partition("=")
+            arg_spec = spec.options.get(option if option.startswith("--") else token)
+            if arg_spec is None:
+                return None
+            
+            if arg_spec.action == "store":
+                if not has_value:
+                    if idx >= len(argv) or argv[idx].startswith("-"):
+                        return None
+                    value = argv[idx]
+                    idx += 1
+                try:
+                    values[arg_spec.dest] = arg_spec.convert(value)
+                except ValueError:
+                    return None
+            elif has_value:
+                return None
+            else:
+                values[arg_spec.dest] = arg_spec.action == "store_true"
+            given.append(arg_spec)
+        
+        if command is None:
+            return None
+        
+        # Distribute positional tokens in order, reserving enough for later ones
+        specs = spec.positionals
+        minimums = [0 if p.nargs in ("?", "*") else 1 if p.nargs in (None, "+") else None
+                    for p in specs]
+        if None in minimums:
+            return None
+        pos = 0
+        for i, p in enumerate(specs):
+            remaining = len(positionals) - pos - sum(minimums[i + 1:])
+            if p.nargs is None:
+                count = 1
+            elif p.nargs == "?":
+                count = min(1, remaining)
+            else:
+                count = remaining
+            if count < minimums[i] or count > remaining:
+                return None
+            chunk = positionals[pos:pos + count]
+            pos += count
+            try:
+                if p.nargs is None:
+                    values[p.dest] = p.convert(chunk[0])
+                elif p.nargs == "?":
+                    values[p.dest] = p.convert(chunk[0]) if chunk else p.default
+                else:
+                    values[p.dest] = [p.convert(v) for v in chunk]
+            except ValueError:
+                return None
+            given.append(p)
+        if pos != len(positionals):
+            return None
+        
+        # Required options and mutually exclusive groups
+        groups = {}
+        for arg_spec in spec.specs():
+            if arg_spec.mutex_group:
+                groups.setdefault(arg_spec.mutex_group, [0, False])
+                groups[arg_spec.mutex_group][0] += given.count(arg_spec) > 0
+                groups[arg_spec.mutex_group][1] |= arg_spec.required
+            elif arg_spec.required and arg_spec not in given:
+                return None
+        for used, required in groups.values():
+            if used > 1 or (required and not used):
+                return None
+        
+        namespace = argparse.Namespace()
+        for arg_spec in self.top_level_spec.specs() + spec.specs():
+            if arg_spec.default is not argparse.SUPPRESS:
+                setattr(namespace, arg_spec.dest, arg_spec.default)
+        for dest, value in values.items():
+            setattr(namespace, dest, value)
+        namespace.func = command.func
+        return namespace
+
 
 # ============================================================================
 # API CLIENT LAYER
 # ============================================================================
 
+# Upper bound on a server-requested Retry-After wait
+MAX_RETRY_AFTER = 60.0
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds"""
+    if not isinstance(value, str):
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        from email.utils import parsedate_to_datetime
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        seconds = retry_at.timestamp() - time.time()
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+def retry_delay(backoff_time: float, retry_after: Optional[float] = None) -> float:
+    """
+    Seconds to wait before the next attempt.
+    
+    Honors a server-provided Retry-After; otherwise jitters the exponential
+    backoff so concurrent workers don't retry in lockstep.
+    """
+    if retry_after is not None:
+        return retry_after
+    
+    import random
+    
+    return backoff_time * (0.5 + random.random())
+
+
 class APIClient:
     """
     REST API client with retry logic, exponential backoff, and authentication.
     
     Features retry logic with exponential backoff, bearer token auth, and proper
-    timeout handling for resilient API communication.
+    timeout handling for resilient API communication. When cache_dir is set,
+    GET responses are cached per endpoint and credential, and a cached entry is
+    revalidated with a conditional request (If-None-Match / If-Modified-Since)
+    on every GET. A nonzero cache_duration opts in to serving entries younger
+    than it without contacting the server. Writes to an endpoint drop the
+    cached entries for it and its parent paths.
     """
     
     def __init__(self, base_url: str, api_key: Optional[str] = None, 
-                 max_retries: int = 3, timeout: int = 30):
+                 max_retries: int = 3, timeout: int = 30, pool_size: int = 32,
+                 cache_dir: Optional[str] = None,
+                 cache_duration: timedelta = timedelta(0)):
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         self.max_retries = max_retries
         self.timeout = timeout
+        self.cache_dir = cache_dir
+        self.cache_duration = cache_duration
+        self._headers = self._build_headers(api_key)
+        self._body_headers = self._build_headers(api_key, has_body=True)
+        
+        requests = _lazy_requests()
         self.session = requests.Session()
+        
+        # Keep-alive pool large enough for concurrent batch workers; retries
+        # are handled in _request, not by urllib3
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=pool_size, max_retries=0
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
-    def _get_headers(self) -> Dict[str, str]:
+    @staticmethod
+    def _build_headers(api_key: Optional[str], has_body: bool = False) -> Dict[str, str]:
         """Generate request headers with authentication"""
-        headers = {"Content-Type": "application/json"}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
+        headers = {"Accept": "application/json"}
+        if has_body:
+            headers["Content-Type"] = "application/json"
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
         return headers
 
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _build_url(base_url: str, endpoint: str) -> str:
+        """Join base URL and endpoint path"""
+        return f"{base_url}/{endpoint.lstrip('/')}"
+
+    def _get_headers(self, has_body: bool = True) -> Dict[str, str]:
+        """Get a mutable copy of the request headers"""
+        return (self._body_headers if has_body else self._headers).copy()
+
     def _request(self, method: str, endpoint: str, 
                  params: Optional[Dict] = None, 
-                 json_data: Optional[Dict] = None) -> requests.Response:
+                 json_data: Optional[Dict] = None,
+                 extra_headers: Optional[Dict[str, str]] = None) -> "requests.Response":
         """
         Make HTTP request with retry logic and exponential backoff.
         
@@ -291,6 +720,7 @@ class APIClient:
             endpoint: API endpoint path
             params: Query parameters
             json_data: JSON request body
+            extra_headers: Additional headers for this request
             
         Returns:
             Response object
@@ -298,8 +728,12 @@ class APIClient:
         Raises:
             CloudTaskException: On request failure after all retries
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        headers = self._get_headers()
+        url = self._build_url(self.base_url, endpoint)
+        # Headers are built once per client; requests doesn't mutate them
+        # Content-Type only when there is a JSON body to describe
+        headers = self._body_headers if json_data is not None else self._headers
+        if extra_headers:
+            headers = {**headers, **extra_headers}
         
         backoff_time = 0.25
         last_exception = None
@@ -318,59 +752,268 @@ class APIClient:
                 # Handle rate limiting with exponential backoff
                 if response.status_code == 429:
                     if attempt < self.max_retries - 1:
-                        time.sleep(backoff_time)
+                        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                        time.sleep(retry_delay(backoff_time, retry_after))
                         backoff_time *= 1.5
                         continue
                 
+                # Other client errors won't change on retry
+                if 400 <= response.status_code < 500 and response.status_code != 429:
+                    raise CloudTaskException(
+                        f"Request failed: HTTP {response.status_code} {response.reason}",
+                        status_code=response.status_code
+                    )
+                
                 response.raise_for_status()
                 return response
                 
-            except requests.exceptions.RequestException as e:
+            except _requests.exceptions.RequestException as e:
                 last_exception = e
                 if attempt < self.max_retries - 1:
-                    time.sleep(backoff_time)
+                    time.sleep(retry_delay(backoff_time))
                     backoff_time *= 1.5
                     continue
         
         raise CloudTaskException(
-            f"Request failed after {self.max_retries} attempts: {last_exception}"
+            f"Request failed after {self.max_retries} attempts: {last_exception}",
+            status_code=getattr(getattr(last_exception, "response", None), "status_code", None)
         )
 
-    def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
-        """Make GET request"""
-        response = self._request("GET", endpoint, params=params)
-        return response.json() if response.content else {}
+    @staticmethod
+    def _digest(value: str) -> str:
+        """Short stable hash used for cache file and directory names"""
+        import hashlib
+        
+        return hashlib.blake2b(value.encode(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _endpoint_cache_dir(cache_dir: str, base_url: str, endpoint: str) -> str:
+        """Directory holding every cached GET response for one endpoint"""
+        return os.path.join(cache_dir,
+                            APIClient._digest(APIClient._build_url(base_url, endpoint)))
+
+    def _response_cache(self, endpoint: str, params: Optional[Dict]) -> "Cache":
+        """Get the cache entry for a GET request, keyed by credential and params"""
+        # The credential is part of the key so clients never share entries
+        key = json.dumps([self._headers.get("Authorization"), params], sort_keys=True)
+        return Cache(os.path.join(self._endpoint_cache_dir(self.cache_dir, self.base_url,
+                                                           endpoint),
+                                  f"{self._digest(key)}.json"),
+                     self.cache_duration)
+
+    @staticmethod
+    def _invalidate(cache_dir: Optional[str], base_url: str, endpoint: str):
+        """Drop cached GET responses for an endpoint and its parent paths"""
+        if not cache_dir:
+            return
+        import shutil
+        
+        parts = endpoint.strip('/').split('/')
+        for depth in range(1, len(parts) + 1):
+            shutil.rmtree(APIClient._endpoint_cache_dir(cache_dir, base_url,
+                                                        '/'.join(parts[:depth])),
+                          ignore_errors=True)
 
-    def post(self, endpoint: str, json_data: Optional[Dict] = None) -> Dict:
-        """Make POST request"""
+    def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
+        """Make GET request, serving and revalidating cached responses"""
+        if not self.cache_dir:
+            response = self._request("GET", endpoint, params=params)
+            return _json_loads(response.content) if response.content else {}
+        
+        cache = self._response_cache(endpoint, params)
+        if self.cache_duration:
+            data = cache.get()
+            if data is not None:
+                return data
+        
+        # Ask the server whether the cached entry changed
+        data, etag, last_modified = cache.get_with_validators()
+        conditional_headers = {}
+        if data is not None:
+            if etag:
+                conditional_headers["If-None-Match"] = etag
+            if last_modified:
+                conditional_headers["If-Modified-Since"] = last_modified
+        
+        response = self._request("GET", endpoint, params=params,
+                                 extra_headers=conditional_headers)
+        if response.status_code == 304 and data is not None:
+            cache.touch()
+            return data
+        
+        data = _json_loads(response.content) if response.content else {}
+        cache.set(data, etag=response.headers.get("ETag"),
+                  last_modified=response.headers.get("Last-Modified"))
+        return data
+
+    def post(self, endpoint: str, json_data: Optional[Dict] = None,
+             invalidate: bool = True) -> Dict:
+        """Make POST request (invalidate=False for read-only POSTs such as search)"""
         response = self._request("POST", endpoint, json_data=json_data)
-        return response.json() if response.content else {}
+        if invalidate:
+            self._invalidate(self.cache_dir, self.base_url, endpoint)
+        return _json_loads(response.content) if response.content else {}
 
     def put(self, endpoint: str, json_data: Optional[Dict] = None) -> Dict:
         """Make PUT request"""
         response = self._request("PUT", endpoint, json_data=json_data)
-        return response.json() if response.content else {}
+        self._invalidate(self.cache_dir, self.base_url, endpoint)
+        return _json_loads(response.content) if response.content else {}
 
     def delete(self, endpoint: str, json_data: Optional[Dict] = None) -> Dict:
         """Make DELETE request"""
         response = self._request("DELETE", endpoint, json_data=json_data)
-        return response.json() if response.content else {}
+        self._invalidate(self.cache_dir, self.base_url, endpoint)
+        return _json_loads(response.content) if response.content else {}
+
+
+class AsyncAPIClient:
+    """
+    Asynchronous REST API client for high-concurrency batch calls.
+    
+    Mirrors APIClient's retry/backoff behavior on top of httpx.AsyncClient
+    (HTTP/2 when the 'h2' package is installed), so many requests can be in
+    flight on a single thread. Requires the optional 'httpx' package. A custom
+    httpx transport (e.g. httpx.MockTransport) may be passed for testing. Writes
+    drop APIClient response cache entries under cache_dir, like the sync client.
+    """
+    
+    def __init__(self, base_url: str, api_key: Optional[str] = None,
+                 max_retries: int = 3, timeout: int = 30, max_connections: int = 64,
+                 transport: Any = None, cache_dir: Optional[str] = None):
+        httpx = _lazy_httpx()
+        if httpx is None:
+            raise CloudTaskException("AsyncAPIClient requires 'httpx'. Install with: pip install httpx")
+        
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.cache_dir = cache_dir
+        self._httpx = httpx
+        self._headers = APIClient._build_headers(api_key)
+        self._body_headers = APIClient._build_headers(api_key, has_body=True)
+        
+        limits = httpx.Limits(max_connections=max_connections,
+                              max_keepalive_connections=max_connections // 2)
+        try:
+            self.client = httpx.AsyncClient(http2=True, limits=limits, timeout=timeout,
+                                            transport=transport)
+        except ImportError:
+            # 'h2' not installed, stay on HTTP/1.1 keep-alive
+            self.client = httpx.AsyncClient(limits=limits, timeout=timeout,
+                                            transport=transport)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.client.aclose()
+
+    async def _request(self, method: str, endpoint: str,
+                       params: Optional[Dict] = None,
+                       json_data: Optional[Dict] = None):
+        """
+        Make HTTP request with retry logic and exponential backoff.
+        
+        Raises:
+            CloudTaskException: On request failure after all retries
+        """
+        import asyncio
+        
+        url = APIClient._build_url(self.base_url, endpoint)
+        headers = self._body_headers if json_data is not None else self._headers
+        
+        backoff_time = 0.25
+        last_exception = None
+        
+        for attempt in range(self.max_retries):
+            try:
+                response = await self.client.request(
+                    method, url, headers=headers, params=params, json=json_data
+                )
+                
+                # Handle rate limiting with exponential backoff
+                if response.status_code == 429:
+                    if attempt < self.max_retries - 1:
+                        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                        await asyncio.sleep(retry_delay(backoff_time, retry_after))
+                        backoff_time *= 1.5
+                        continue
+                
+                # Other client errors won't change on retry
+                if 400 <= response.status_code < 500 and response.status_code != 429:
+                    raise CloudTaskException(
+                        f"Request failed: HTTP {response.status_code} {response.reason_phrase}",
+                        status_code=response.status_code
+                    )
+                
+                response.raise_for_status()
+                return response
+                
+            except self._httpx.HTTPError as e:
+                last_exception = e
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(retry_delay(backoff_time))
+                    backoff_time *= 1.5
+                    continue
+        
+        raise CloudTaskException(
+            f"Request failed after {self.max_retries} attempts: {last_exception}",
+            status_code=getattr(getattr(last_exception, "response", None), "status_code", None)
+        )
+
+    async def put(self, endpoint: str, json_data: Optional[Dict] = None) -> Dict:
+        """Make PUT request"""
+        response = await self._request("PUT", endpoint, json_data=json_data)
+        APIClient._invalidate(self.cache_dir, self.base_url, endpoint)
+        return _json_loads(response.content) if response.content else {}
 
 
 # ============================================================================
 # QUERY DSL - COMPLEX FILTERING SYSTEM
 # ============================================================================
 
+# Pattern to match: field operator value
+_QUERY_RE = re.compile(
+    r"([a-zA-Z0-9_]+)( *[=><!]+| +(?:[lg]te?|nin|neq|eq|not ?eq|not ?in|in) )?( *)(\[[^\]]+\]|\"[^\"]+\"|[^ ]+)?( *)"
+)
+
+# Operator mapping
+_OP_NAMES = {
+    ">=": "gte", ">": "gt", "gt": "gt", "gte": "gte",
+    "<=": "lte", "<": "lt", "lt": "lt", "lte": "lte",
+    "!=": "neq", "==": "eq", "=": "eq", "eq": "eq", "neq": "neq",
+    "noteq": "neq", "not eq": "neq",
+    "notin": "notin", "not in": "notin", "nin": "notin",
+    "in": "in",
+}
+
+# Whitespace or operator characters mean the query is not a single bare word
+_BARE_WORD_EXCLUDE = re.compile(r"[\s=<>!]")
+
+# Literal values coerced to Python constants
+_COERCE = {
+    "true": True, "True": True,
+    "false": False, "False": False,
+    "None": None, "null": None,
+}
+
+
 def parse_query(query_str: Optional[str], base_query: Optional[Dict] = None,
                 valid_fields: Optional[set] = None,
                 field_aliases: Optional[Dict] = None,
-                field_multipliers: Optional[Dict] = None) -> Dict:
+                field_multipliers: Optional[Dict] = None,
+                default_field: Optional[str] = None) -> Dict:
     """
     Parse query string into structured query dictionary.
     
     Query Syntax:
         field op value [field op value ...]
         
+    A lone word without an operator matches default_field for equality,
+    when one is given.
+        
     Operators:
         <, <=, ==, !=, >=, >, in, notin, eq, neq, gt, gte, lt, lte
         
@@ -378,45 +1021,77 @@ def parse_query(query_str: Optional[str], base_query: Optional[Dict] = None,
         "priority >= 5 status == active tags in [work,urgent]"
         "created > 2024-01-01 assigned != none"
     """
+    if isinstance(query_str, list):
+        query_str = " ".join(query_str)
+    
     if query_str is None or not query_str.strip():
         return base_query or {}
     
+    query_str = query_str.strip()
+    
+    # A single bare word is an equality match on the default field, normalized
+    # like any other DSL value
+    if default_field and not _BARE_WORD_EXCLUDE.search(query_str):
+        query_str = f"{default_field} == {query_str}"
+    
+    conditions, unknown_fields = _parse_conditions(
+        query_str,
+        frozenset(valid_fields or ()),
+        tuple((field_aliases or {}).items()),
+        tuple((field_multipliers or {}).items()),
+    )
+    
+    for field in unknown_fields:
+        print(f"Warning: Unrecognized field '{field}'", file=sys.stderr)
+    
+    # Build query structure (fresh dicts/lists, the cached parse is shared)
     result = base_query.copy() if base_query else {}
-    field_aliases = field_aliases or {}
-    field_multipliers = field_multipliers or {}
-    valid_fields = valid_fields or set()
+    for field, op_name, value in conditions:
+        if op_name is None:
+            result.pop(field, None)
+            continue
+        if isinstance(value, tuple):
+            value = list(value)
+        result[field] = {**result.get(field, {}), op_name: value}
     
-    if isinstance(query_str, list):
-        query_str = " ".join(query_str)
+    return result
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_conditions(query_str: str, valid_fields: frozenset,
+                      field_aliases: Tuple, field_multipliers: Tuple):
+    """
+    Tokenize a query string into normalized conditions (memoized).
     
-    query_str = query_str.strip()
+    Returns (conditions, unknown_fields) where conditions is a tuple of
+    (field, op_name, value); op_name is None for a wildcard that clears the
+    field, and list values are returned as tuples.
+    """
+    field_aliases = dict(field_aliases)
+    field_multipliers = dict(field_multipliers)
     
-    # Pattern to match: field operator value
-    pattern = r"([a-zA-Z0-9_]+)( *[=><!]+| +(?:[lg]te?|nin|neq|eq|not ?eq|not ?in|in) )?( *)(\[[^\]]+\]|\"[^\"]+\"|[^ ]+)?( *)"
-    matches = re.findall(pattern, query_str)
+    # Collect contiguous matches; a gap or leftover tail is unconsumed text
+    matches = []
+    consumed = 0
+    for match in _QUERY_RE.finditer(query_str):
+        if match.start() != consumed:
+            break
+        matches.append(match.groups(""))
+        consumed = match.end()
     
-    # Verify entire string was consumed
-    reconstructed = "".join("".join(m) for m in matches)
-    if reconstructed != query_str:
+    if consumed != len(query_str):
         raise ValueError(
-            f"Failed to parse query. Unconsumed text: {repr(query_str)}\n"
+            f"Failed to parse query at position {consumed}. "
+            f"Unconsumed text: {repr(query_str[consumed:consumed + 20])}\n"
             f"Did you forget to quote your query?"
         )
     
-    # Operator mapping
-    op_names = {
-        ">=": "gte", ">": "gt", "gt": "gt", "gte": "gte",
-        "<=": "lte", "<": "lt", "lt": "lt", "lte": "lte",
-        "!=": "neq", "==": "eq", "=": "eq", "eq": "eq", "neq": "neq",
-        "noteq": "neq", "not eq": "neq",
-        "notin": "notin", "not in": "notin", "nin": "notin",
-        "in": "in",
-    }
-    
+    conditions = []
+    unknown_fields = []
     for field, op, _, value, _ in matches:
         value = value.strip(",[]\"")
         op = op.strip()
-        op_name = op_names.get(op)
+        op_name = _OP_NAMES.get(op)
         
         # Apply field aliases
         if field in field_aliases:
@@ -424,7 +1099,7 @@ def parse_query(query_str: Optional[str], base_query: Optional[Dict] = None,
         
         # Validate field
         if valid_fields and field not in valid_fields:
-            print(f"Warning: Unrecognized field '{field}'", file=sys.stderr)
+            unknown_fields.append(field)
         
         if not op_name:
             raise ValueError(f"Unknown operator: {repr(op)}")
@@ -436,12 +1111,12 @@ def parse_query(query_str: Optional[str], base_query: Optional[Dict] = None,
         if value in ["?", "*", "any"]:
             if op_name != "eq":
                 raise ValueError("Wildcard only valid with '=' operator")
-            result.pop(field, None)
+            conditions.append((field, None, None))
             continue
         
         # Handle list values for 'in' and 'notin' operators
         if op_name in ["in", "notin"]:
-            value = [v.strip().replace('_', ' ') for v in value.split(",") if v.strip()]
+            value = tuple(v.strip().replace('_', ' ') for v in value.split(",") if v.strip())
         else:
             value = value.replace('_', ' ')
         
@@ -453,61 +1128,148 @@ def parse_query(query_str: Optional[str], base_query: Optional[Dict] = None,
                 pass
         
         # Type coercion
-        if value == 'true' or value == 'True':
-            value = True
-        elif value == 'false' or value == 'False':
-            value = False
-        elif value == 'None' or value == 'null':
-            value = None
-        
-        # Build query structure
-        if field not in result:
-            result[field] = {}
-        result[field][op_name] = value
+        if isinstance(value, str):
+            value = _COERCE.get(value, value)
+        
+        conditions.append((field, op_name, value))
     
-    return result
+    return tuple(conditions), tuple(unknown_fields)
 
 
 # ============================================================================
 # CACHING SYSTEM
 # ============================================================================
 
+def _atomic_write(path: str, data: bytes):
+    """
+    Write data to a temp file beside path, then rename it into place.
+    
+    Symlinks are followed so the link itself survives (e.g. a dotfiles-managed
+    config), and an existing file keeps its permission bits.
+    """
+    import tempfile
+    
+    path = os.path.realpath(path)
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+    
+    directory = os.path.dirname(path) or "."
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path),
+                                        suffix=".tmp")
+    except FileNotFoundError:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path),
+                                        suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 class Cache:
     """
     File-based cache with time-based expiration.
+    
+    Entries are stored with optional HTTP validators (ETag / Last-Modified) so
+    expired data can be revalidated instead of re-downloaded.
     """
     
     def __init__(self, cache_file: str, duration: timedelta):
         self.cache_file = cache_file
         self.duration = duration
+        self._duration_seconds = duration.total_seconds()
+
+    def _is_fresh(self, st: os.stat_result) -> bool:
+        """Check a stat result of the cache file against the expiry duration"""
+        return time.time() - st.st_mtime < self._duration_seconds
 
     def is_valid(self) -> bool:
         """Check if cache exists and is not expired"""
-        if not os.path.exists(self.cache_file):
+        try:
+            return self._is_fresh(os.stat(self.cache_file))
+        except OSError:
             return False
-        
-        cache_age = datetime.now() - datetime.fromtimestamp(
-            os.path.getmtime(self.cache_file)
-        )
-        return cache_age < self.duration
 
-    def get(self) -> Optional[Dict]:
-        """Get cached data if valid"""
-        if not self.is_valid():
-            return None
-        
+    def _read_entry(self, check_fresh: bool) -> Optional[Dict]:
+        """Read the stored entry, optionally only if it has not expired"""
+        # Open first and fstat the handle: one stat per lookup, and the
+        # freshness check applies to the file that is actually read
         try:
-            with open(self.cache_file, 'r') as f:
-                return json.load(f)
+            with open(self.cache_file, 'rb') as f:
+                st = os.fstat(f.fileno())
+                if check_fresh and not self._is_fresh(st):
+                    return None
+                entry = self._load(f, st.st_size)
+        except FileNotFoundError:
+            return None
         except (IOError, json.JSONDecodeError) as e:
             print(f"Warning: Failed to read cache: {e}", file=sys.stderr)
             return None
+        
+        # Entries written by older versions held the bare data
+        if not isinstance(entry, dict) or "data" not in entry:
+            return None
+        return entry
 
-    def set(self, data: Dict) -> bool:
-        """Write data to cache"""
+    def get(self) -> Optional[Dict]:
+        """Get cached data if valid"""
+        entry = self._read_entry(check_fresh=True)
+        return entry["data"] if entry else None
+
+    def get_with_validators(self) -> Tuple[Optional[Dict], Optional[str], Optional[str]]:
+        """Get (data, etag, last_modified) for the entry, even if expired"""
+        entry = self._read_entry(check_fresh=False)
+        if not entry:
+            return None, None, None
+        return entry["data"], entry.get("etag"), entry.get("last_modified")
+
+    def touch(self):
+        """Mark the entry as fresh again (e.g. after a 304 Not Modified)"""
         try:
-            with open(self.cache_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            os.utime(self.cache_file)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _load(f, size: int) -> Dict:
+        """Parse an open cache file, mapping it into memory when large"""
+        loads, _, loads_buffer = _get_json_codec()
+        if not loads_buffer or size <= CACHE_MMAP_THRESHOLD:
+            return loads(f.read())
+        
+        import mmap
+        
+        with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            with memoryview(mm) as view:
+                return loads(view)
+
+    def set(self, data: Dict, etag: Optional[str] = None,
+            last_modified: Optional[str] = None) -> bool:
+        """Write data to cache along with its HTTP validators"""
+        entry = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "cached_at": time.time(),
+            "data": data,
+        }
+        try:
+            # Compact and atomic: the cache is machine-read only
+            _atomic_write(self.cache_file, _json_dumps(entry, indent=False))
             return True
         except IOError as e:
             print(f"Warning: Failed to write cache: {e}", file=sys.stderr)
@@ -534,13 +1296,22 @@ class Config:
     def __init__(self, config_file: str):
         self.config_file = config_file
         self._config = self._load()
+        self._dirty = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # Write batched changes once, and only if nothing went wrong
+        if exc_type is None and self._dirty:
+            self.save()
 
     def _load(self) -> Dict:
         """Load configuration from file"""
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    return _json_loads(f.read())
             except (IOError, json.JSONDecodeError):
                 pass
         return {}
@@ -548,8 +1319,8 @@ class Config:
     def save(self) -> bool:
         """Save configuration to file"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self._config, f, indent=2)
+            _atomic_write(self.config_file, _json_dumps(self._config))
+            self._dirty = False
             return True
         except IOError as e:
             print(f"Error: Failed to save config: {e}", file=sys.stderr)
@@ -562,30 +1333,55 @@ class Config:
     def set(self, key: str, value: Any):
         """Set configuration value"""
         self._config[key] = value
+        self._dirty = True
 
     def delete(self, key: str):
         """Delete configuration value"""
-        self._config.pop(key, None)
+        if key in self._config:
+            del self._config[key]
+            self._dirty = True
 
 
 # ============================================================================
 # CONCURRENT OPERATIONS
 # ============================================================================
 
+# Name prefix of the shared execute_concurrent worker threads
+POOL_THREAD_PREFIX = "cloudtask-pool"
+
+
+@functools.lru_cache(maxsize=None)
+def _get_thread_pool(max_workers: int):
+    """Shared thread pool per worker count, reused across execute_concurrent calls"""
+    from concurrent.futures import ThreadPoolExecutor
+    
+    # Idle workers are joined by concurrent.futures at interpreter exit
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=POOL_THREAD_PREFIX)
+
+
 def execute_concurrent(func, items: List, max_workers: int = 8, 
-                       max_retries: int = 3) -> List:
+                       max_retries: int = 3, inflight: Optional[int] = None) -> List:
     """
     Execute function concurrently on multiple items with retry logic.
     
+    Items are submitted through a bounded window and results are collected as
+    they complete, so a slow item doesn't hold up the others.
+    
     Args:
         func: Function to execute on each item
-        items: List of items to process
-        max_workers: Maximum number of concurrent workers
+        items: Iterable of items to process
+        max_workers: Maximum number of concurrent workers (1 runs inline)
         max_retries: Maximum retry attempts per item
+        inflight: Maximum submitted-but-unfinished items (default 2 * max_workers)
         
     Returns:
-        List of results
+        List of results, in completion order
     """
+    import itertools
+    import threading
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+    
+    inflight = inflight or max_workers * 2
     results = []
     
     def worker_with_retry(item):
@@ -603,14 +1399,84 @@ def execute_concurrent(func, items: List, max_workers: int = 8,
                 if attempt == max_retries - 1:
                     print(f"Error processing {item}: {e}", file=sys.stderr)
                     return None
-                time.sleep(backoff_time)
+                time.sleep(retry_delay(backoff_time))
                 backoff_time *= 1.5
         
         return None
     
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        results = list(executor.map(worker_with_retry, items))
+    # A single worker gains nothing from a pool; run inline
+    if max_workers <= 1:
+        results = [worker_with_retry(item) for item in items]
+        return [result for result in results if result is not None]
+    
+    # Called from one of the shared workers (nested batch work): waiting on the
+    # shared pool could deadlock once every worker blocks, so use a private one
+    nested = threading.current_thread().name.startswith(POOL_THREAD_PREFIX)
+    executor = ThreadPoolExecutor(max_workers=max_workers) if nested \
+        else _get_thread_pool(max_workers)
+    
+    item_iter = iter(items)
+    try:
+        pending = {executor.submit(worker_with_retry, item)
+                   for item in itertools.islice(item_iter, inflight)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if result is not None:
+                    results.append(result)
+            # Refill the window with as many items as just finished
+            for item in itertools.islice(item_iter, len(done)):
+                pending.add(executor.submit(worker_with_retry, item))
+    finally:
+        if nested:
+            executor.shutdown()
+    
+    return results
+
+
+async def execute_async(func, items: List, concurrency: int = 64,
+                        max_retries: int = 3) -> List:
+    """
+    Run a coroutine function on multiple items with bounded concurrency.
+    
+    Async counterpart of execute_concurrent for I/O-bound work: all items run
+    on one event loop, limited by a semaphore, and backoff waits don't hold a
+    thread.
+    
+    Args:
+        func: Coroutine function to execute on each item
+        items: List of items to process
+        concurrency: Maximum number of items in flight
+        max_retries: Maximum retry attempts per item
+        
+    Returns:
+        List of results
+    """
+    import asyncio
+    
+    semaphore = asyncio.Semaphore(concurrency)
     
+    async def worker_with_retry(item):
+        """Worker coroutine with retry logic"""
+        backoff_time = 0.25
+        
+        async with semaphore:
+            for attempt in range(max_retries):
+                try:
+                    if isinstance(item, tuple):
+                        return await func(*item)
+                    return await func(item)
+                except Exception as e:
+                    if attempt == max_retries - 1:
+                        print(f"Error processing {item}: {e}", file=sys.stderr)
+                        return None
+                    await asyncio.sleep(retry_delay(backoff_time))
+                    backoff_time *= 1.5
+        
+        return None
+    
+    results = await asyncio.gather(*(worker_with_retry(item) for item in items))
     return [r for r in results if r is not None]
 
 
@@ -618,6 +1484,19 @@ def execute_concurrent(func, items: List, max_workers: int = 8,
 # DISPLAY UTILITIES
 # ============================================================================
 
+@functools.lru_cache(maxsize=16)
+def _compile_fields(fields: Tuple[Tuple[str, str, str, Any, bool], ...]) -> Tuple:
+    """Precompute (key, render) pairs where render maps a value to cell text"""
+    renderers = []
+    for key, _, fmt, transform, _ in fields:
+        if transform:
+            render = lambda value, fmt=fmt.format, transform=transform: fmt(transform(value))
+        else:
+            render = fmt.format
+        renderers.append((key, render))
+    return tuple(renderers)
+
+
 def display_table(rows: List[Dict], fields: Tuple[Tuple[str, str, str, Any, bool], ...]):
     """
     Display data in formatted table.
@@ -634,38 +1513,31 @@ def display_table(rows: List[Dict], fields: Tuple[Tuple[str, str, str, Any, bool
     headers = [display_name for _, display_name, _, _, _ in fields]
     out_rows = [headers]
     
-    # Calculate column widths
-    col_widths = [len(h) for h in headers]
-    
-    # Process each row
+    # Process each row: one lookup and one render call per cell
+    renderers = _compile_fields(fields)
     for row in rows:
-        display_row = []
-        for idx, (key, _, fmt, transform, _) in enumerate(fields):
-            value = row.get(key)
-            
-            if value is None:
-                text = "-"
-            else:
-                if transform:
-                    value = transform(value)
-                text = fmt.format(value)
-            
-            text = text.replace(' ', '_')
-            col_widths[idx] = max(col_widths[idx], len(text))
-            display_row.append(text)
-        
-        out_rows.append(display_row)
-    
-    # Print table
-    for row in out_rows:
-        formatted_cols = []
-        for text, width, field_info in zip(row, col_widths, fields):
-            _, _, _, _, left_justify = field_info
-            if left_justify:
-                formatted_cols.append(text.ljust(width))
-            else:
-                formatted_cols.append(text.rjust(width))
-        print("  ".join(formatted_cols))
+        get = row.get
+        out_rows.append([
+            "-" if (value := get(key)) is None else render(value).replace(' ', '_')
+            for key, render in renderers
+        ])
+    
+    # Calculate column widths, one C-level max() per column
+    col_widths = [max(map(len, column)) for column in zip(*out_rows)]
+    just_funcs = [str.ljust if left_justify else str.rjust
+                  for _, _, _, _, left_justify in fields]
+    
+    # Print table in a single write
+    lines = [
+        "  ".join([just(text, width) for just, text, width in zip(just_funcs, row, col_widths)])
+        for row in out_rows
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def print_json(data: Any):
+    """Print data as indented JSON"""
+    sys.stdout.write(_json_dumps(data).decode() + "\n")
 
 
 def format_timestamp(ts: float) -> str:
@@ -675,12 +1547,10 @@ def format_timestamp(ts: float) -> str:
 
 def deindent(text: str) -> str:
     """Remove common leading whitespace from multiline strings"""
-    text = re.sub(r" *$", "", text, flags=re.MULTILINE)
-    indents = [len(x) for x in re.findall("^ *(?=[^ ])", text, re.MULTILINE) if x]
-    if indents:
-        min_indent = min(indents)
-        text = re.sub(r"^ {," + str(min_indent) + "}", "", text, flags=re.MULTILINE)
-    return text.strip()
+    lines = [line.rstrip(" ") for line in text.split("\n")]
+    leading = [len(line) - len(line.lstrip(" ")) for line in lines]
+    min_indent = min((n for n in leading if n), default=0)
+    return "\n".join(line[min(n, min_indent):] for line, n in zip(lines, leading)).strip()
 
 
 # ============================================================================
@@ -704,10 +1574,8 @@ parser.add_argument("--explain", help="Show request details without executing",
 api_client: Optional[APIClient] = None
 
 
-def get_api_client(args: argparse.Namespace) -> APIClient:
-    """Get or create API client instance"""
-    global api_client
-    
+def get_api_key(args: argparse.Namespace) -> Optional[str]:
+    """Get API key from arguments or the saved key file"""
     api_key = args.api_key
     if not api_key and os.path.exists(API_KEY_FILE):
         try:
@@ -715,8 +1583,17 @@ def get_api_client(args: argparse.Namespace) -> APIClient:
                 api_key = f.read().strip()
         except IOError:
             pass
+    return api_key
+
+
+def get_api_client(args: argparse.Namespace) -> APIClient:
+    """Get or create API client instance"""
+    global api_client
     
+    api_key = get_api_key(args)
     if not api_client or api_client.api_key != api_key:
+        # No command reads through get() yet; pass cache_dir=RESPONSE_CACHE_DIR
+        # once one does, so writes don't pay for cache invalidation until then
         api_client = APIClient(args.url, api_key)
     
     return api_client
@@ -783,13 +1660,13 @@ def create__task(args: argparse.Namespace):
     
     if args.explain:
         print("Would create task with data:")
-        print(json.dumps(task_data, indent=2))
+        print_json(task_data)
         return
     
     try:
         result = client.post("/tasks", task_data)
         if args.raw:
-            print(json.dumps(result, indent=2))
+            print_json(result)
         else:
             print(f"Task created successfully: ID {result.get('id')}")
     except CloudTaskException as e:
@@ -826,7 +1703,8 @@ def search__tasks(args: argparse.Namespace):
             args.query,
             base_query={},
             valid_fields=TASK_FIELDS,
-            field_aliases=TASK_ALIASES
+            field_aliases=TASK_ALIASES,
+            default_field="title"
         )
         
         # Add ordering
@@ -837,13 +1715,13 @@ def search__tasks(args: argparse.Namespace):
         
         if args.explain:
             print("Query:")
-            print(json.dumps(query, indent=2))
+            print_json(query)
             return
         
-        result = client.post("/tasks/search", query)
+        result = client.post("/tasks/search", query, invalidate=False)
         
         if args.raw:
-            print(json.dumps(result, indent=2))
+            print_json(result)
         else:
             tasks = result.get("tasks", [])
             display_table(tasks, TASK_DISPLAY_FIELDS)
@@ -868,7 +1746,7 @@ def delete__task(args: argparse.Namespace):
     try:
         result = client.delete(f"/tasks/{args.task_id}")
         if args.raw:
-            print(json.dumps(result, indent=2))
+            print_json(result)
         else:
             print(f"Task {args.task_id} deleted successfully")
     except CloudTaskException as e:
@@ -880,16 +1758,18 @@ def delete__task(args: argparse.Namespace):
     argument("task_ids", help="Task IDs to update", type=int, nargs="+"),
     argument("--status", help="New status", type=str),
     argument("--priority", help="New priority", type=int),
+    argument("--no-async", help="Use threads instead of asyncio for per-task fallback",
+             action="store_true"),
     help="Batch update multiple tasks"
 )
 def update__tasks(args: argparse.Namespace):
     """
-    Update multiple tasks concurrently.
+    Update multiple tasks in one bulk request.
     
-    Demonstrates concurrent operations with ThreadPoolExecutor.
+    Falls back to per-task PUTs when the server has no bulk endpoint: asyncio
+    with AsyncAPIClient when httpx is installed (unless --no-async), otherwise
+    a ThreadPoolExecutor via execute_concurrent.
     """
-    client = get_api_client(args)
-    
     update_data = {}
     if args.status:
         update_data["status"] = args.status
@@ -902,9 +1782,63 @@ def update__tasks(args: argparse.Namespace):
     
     if args.explain:
         print(f"Would update tasks {args.task_ids} with:")
-        print(json.dumps(update_data, indent=2))
+        print_json(update_data)
         return
     
+    client = get_api_client(args)
+    try:
+        response = client.post("/tasks/bulk_update",
+                               {"ids": args.task_ids, "updates": update_data})
+        results = _bulk_update_results(args.task_ids, response)
+    except CloudTaskException as e:
+        if e.status_code in BULK_UNSUPPORTED_STATUSES:
+            results = _update_tasks_individually(args, client, update_data)
+        else:
+            results = [f"Task {task_id}: Error - {e}" for task_id in args.task_ids]
+    
+    for result in results:
+        print(result)
+
+
+def _bulk_update_results(task_ids: List[int], response: Dict) -> List[str]:
+    """
+    Per-task result lines from a bulk update response.
+    
+    Understands {"results": [{"id", "error"/"success"}, ...]} and
+    {"updated": [ids]}; ids the response doesn't confirm are reported as errors.
+    A response with neither key means the whole batch was accepted.
+    """
+    response = response if isinstance(response, dict) else {}
+    
+    if isinstance(response.get("results"), list):
+        by_id = {r.get("id"): r for r in response["results"] if isinstance(r, dict)}
+        lines = []
+        for task_id in task_ids:
+            result = by_id.get(task_id)
+            if result is None:
+                lines.append(f"Task {task_id}: Error - missing from bulk update response")
+            elif result.get("error") or result.get("success") is False:
+                lines.append(f"Task {task_id}: Error - {result.get('error') or 'rejected'}")
+            else:
+                lines.append(f"Task {task_id}: Success")
+        return lines
+    
+    if isinstance(response.get("updated"), list):
+        updated = set(response["updated"])
+        return [f"Task {task_id}: Success" if task_id in updated
+                else f"Task {task_id}: Error - not updated"
+                for task_id in task_ids]
+    
+    return [f"Task {task_id}: Success" for task_id in task_ids]
+
+
+def _update_tasks_individually(args: argparse.Namespace, client: APIClient,
+                               update_data: Dict) -> List[str]:
+    """Send one PUT per task, concurrently"""
+    if not args.no_async and _lazy_httpx() is not None:
+        import asyncio
+        return asyncio.run(_update_tasks_async(args, update_data, client.cache_dir))
+    
     def update_task(task_id: int):
         try:
             result = client.put(f"/tasks/{task_id}", update_data)
@@ -913,10 +1847,21 @@ def update__tasks(args: argparse.Namespace):
             return f"Task {task_id}: Error - {e}"
     
     # Execute updates concurrently
-    results = execute_concurrent(update_task, args.task_ids, max_workers=8)
-    
-    for result in results:
-        print(result)
+    return execute_concurrent(update_task, args.task_ids, max_workers=8)
+
+
+async def _update_tasks_async(args: argparse.Namespace, update_data: Dict,
+                              cache_dir: Optional[str] = None) -> List[str]:
+    """Send the batch of task updates over one async client"""
+    async with AsyncAPIClient(args.url, get_api_key(args), cache_dir=cache_dir) as client:
+        async def update_task(task_id: int):
+            try:
+                await client.put(f"/tasks/{task_id}", update_data)
+                return f"Task {task_id}: Success"
+            except CloudTaskException as e:
+                return f"Task {task_id}: Error - {e}"
+        
+        return await execute_async(update_task, args.task_ids)
 
 
 @parser.command(
@@ -926,9 +1871,13 @@ def update__tasks(args: argparse.Namespace):
 def set__api_key(args: argparse.Namespace):
     """Save API key to configuration file"""
     try:
-        with open(API_KEY_FILE, 'w') as f:
-            f.write(args.api_key)
-        os.chmod(API_KEY_FILE, 0o600)  # Secure permissions
+        os.makedirs(DIRS['config'], exist_ok=True)
+        # Create with owner-only permissions so the key is never world-readable;
+        # the mode only applies on creation, so also tighten an existing file
+        fd = os.open(API_KEY_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            f.write(args.key)
         print(f"API key saved to {API_KEY_FILE}")
     except IOError as e:
         print(f"Error: Failed to save API key: {e}", file=sys.stderr)
@@ -940,8 +1889,6 @@ def set__api_key(args: argparse.Namespace):
 )
 def show__config(args: argparse.Namespace):
     """Display current configuration"""
-    config = Config(CONFIG_FILE)
-    
     print("Configuration:")
     print(f"  Config file: {CONFIG_FILE}")
     print(f"  API key file: {API_KEY_FILE}")
@@ -955,8 +1902,11 @@ def show__config(args: argparse.Namespace):
 )
 def clear__cache(args: argparse.Namespace):
     """Clear the application cache"""
+    import shutil
+    
     cache = Cache(CACHE_FILE, CACHE_DURATION)
     cache.clear()
+    shutil.rmtree(RESPONSE_CACHE_DIR, ignore_errors=True)
     print("Cache cleared successfully")
 
 
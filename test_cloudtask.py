@@ -3,95 +3,218 @@ Tests for CloudTask CLI
 """
 
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 from datetime import datetime, timedelta
+import functools
 import json
 import tempfile
+import threading
+import time
+from types import SimpleNamespace
 import os
 
 # Import modules to test
 import sys
 sys.path.insert(0, os.path.dirname(__file__))
 
+import cloudtask
+
 from cloudtask import (
     parse_query,
     Cache,
     Config,
     APIClient,
+    AsyncAPIClient,
     CloudTaskException,
+    CommandParserWrapper,
+    argument,
+    execute_async,
     execute_concurrent,
+    display_table,
     format_timestamp,
-    deindent
+    deindent,
+    parse_retry_after,
 )
 
+# requests is imported lazily by cloudtask; only the API client tests need it
+try:
+    import requests
+except ImportError:
+    requests = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 
 class TestQueryParser(unittest.TestCase):
     """Test the query DSL parser"""
     
-    def test_simple_equality(self):
-        result = parse_query("status == active")
-        self.assertEqual(result, {"status": {"eq": "active"}})
+    # (query, kwargs, expected result)
+    CASES = [
+        ("status == active", {}, {"status": {"eq": "active"}}),
+        ("priority >= 5", {}, {"priority": {"gte": "5"}}),
+        ("tags in [work,urgent]", {}, {"tags": {"in": ["work", "urgent"]}}),
+        ("priority >= 7 status == active", {},
+         {"priority": {"gte": "7"}, "status": {"eq": "active"}}),
+        ("prio >= 5", {"field_aliases": {"prio": "priority"}},
+         {"priority": {"gte": "5"}}),
+        ("size >= 10", {"field_multipliers": {"size": 1024}},
+         {"size": {"gte": 10240.0}}),
+        ("status = any", {}, {}),
+        ("completed == True", {}, {"completed": {"eq": True}}),
+        ("archived == False", {}, {"archived": {"eq": False}}),
+        ("assigned_to == None", {}, {"assigned_to": {"eq": None}}),
+        (["priority", ">=", "3"], {}, {"priority": {"gte": "3"}}),
+        ("bugfix", {"default_field": "title"}, {"title": {"eq": "bugfix"}}),
+        ("fix_login", {"default_field": "title"}, {"title": {"eq": "fix login"}}),
+        ('"bugfix"', {"default_field": "title"}, {"title": {"eq": "bugfix"}}),
+        ("any", {"default_field": "title"}, {}),
+        ("*", {"default_field": "title"}, {}),
+        ("true", {"default_field": "title"}, {"title": {"eq": True}}),
+    ]
     
-    def test_numeric_comparison(self):
-        result = parse_query("priority >= 5")
-        self.assertEqual(result, {"priority": {"gte": "5"}})
+    def test_parse_cases(self):
+        for query, kwargs, expected in self.CASES:
+            with self.subTest(query=query):
+                self.assertEqual(parse_query(query, **kwargs), expected)
     
-    def test_in_operator(self):
-        result = parse_query("tags in [work,urgent]")
-        self.assertEqual(result, {"tags": {"in": ["work", "urgent"]}})
+    def test_invalid_operator_raises_error(self):
+        with self.assertRaises(ValueError):
+            parse_query("status ~= invalid")
     
-    def test_multiple_conditions(self):
-        result = parse_query("priority >= 7 status == active")
-        expected = {
-            "priority": {"gte": "7"},
-            "status": {"eq": "active"}
-        }
-        self.assertEqual(result, expected)
+    def test_unconsumed_text_raises_error(self):
+        with self.assertRaisesRegex(ValueError, "position 17.*'%%'"):
+            parse_query("status == active %%")
     
-    def test_field_aliases(self):
-        aliases = {"prio": "priority"}
-        result = parse_query("prio >= 5", field_aliases=aliases)
-        self.assertEqual(result, {"priority": {"gte": "5"}})
+    def test_bare_word_without_default_field_raises_error(self):
+        with self.assertRaises(ValueError):
+            parse_query("bugfix")
     
-    def test_field_multipliers(self):
-        multipliers = {"size": 1024}
-        result = parse_query("size >= 10", field_multipliers=multipliers)
-        self.assertEqual(result, {"size": {"gte": 10240.0}})
+    def test_repeated_query_returns_fresh_result(self):
+        first = parse_query("tags in [work,urgent]")
+        first["tags"]["in"].append("home")
+        first["limit"] = 10
+        second = parse_query("tags in [work,urgent]")
+        self.assertEqual(second, {"tags": {"in": ["work", "urgent"]}})
+
+
+class TestCommandParser(unittest.TestCase):
+    """Test decorator-based command registration"""
     
-    def test_invalid_operator_raises_error(self):
-        with self.assertRaises(ValueError):
-            parse_query("status ~= invalid")
+    def setUp(self):
+        self.parser = CommandParserWrapper(prog="cloudtask")
+        self.parser.add_argument("--raw", action="store_true")
+        
+        @self.parser.command(argument("--title", required=True), help="Create")
+        def create__task(args):
+            return "created"
+        
+        @self.parser.command(argument("task_id", type=int), help="Delete")
+        def delete__task(args):
+            return "deleted"
     
-    def test_wildcard_value(self):
-        result = parse_query("status = any")
-        self.assertEqual(result, {})
+    def test_only_selected_command_is_built(self):
+        args = self.parser.parser.parse_args(["delete task", "42"])
+        self.assertEqual(args.task_id, 42)
+        self.assertEqual(args.func(args), "deleted")
+        self.assertEqual(len(self.parser.subparser_objs), 1)
     
-    def test_boolean_values(self):
-        result = parse_query("completed == True")
-        self.assertEqual(result, {"completed": {"eq": True}})
+    def test_fast_path_skips_argparse(self):
+        args = self.parser.parse_args(["delete", "task", "42"])
+        self.assertEqual(args.task_id, 42)
+        self.assertEqual(self.parser.subparser_objs, [])
+    
+    def test_verb_joined_only_with_registered_object(self):
+        args = self.parser.parse_args(["create", "task", "--title", "delete"])
+        self.assertEqual(args.title, "delete")
+        with self.assertRaises(SystemExit), patch('sys.stderr'):
+            self.parser.parse_args(["create", "--title", "x"])
+    
+    def test_mutex_group(self):
+        @self.parser.command(
+            argument("--json", action="store_true", mutex_group="fmt", required=True),
+            argument("--csv", action="store_true", mutex_group="fmt"),
+            help="Export"
+        )
+        def export(args):
+            return "exported"
         
-        result = parse_query("archived == False")
-        self.assertEqual(result, {"archived": {"eq": False}})
+        self.assertTrue(self.parser.parse_args(["export", "--csv"]).csv)
+        self.assertTrue(self.parser.parser.parse_args(["export", "--json"]).json)
+        for argv in (["export"], ["export", "--json", "--csv"]):
+            with self.subTest(argv=argv), self.assertRaises(SystemExit), patch('sys.stderr'):
+                self.parser.parse_args(argv)
+    
+    def test_fast_path_matches_argparse(self):
+        for argv in (["--raw", "delete task", "7"],
+                     ["create task", "--title=Report"],
+                     ["create task", "--title", "Report"]):
+            with self.subTest(argv=argv):
+                fast = self.parser._parse_args_fast(argv)
+                self.assertIsNotNone(fast)
+                self.assertEqual(fast, self.parser.parser.parse_args(argv))
     
-    def test_none_values(self):
-        result = parse_query("assigned_to == None")
-        self.assertEqual(result, {"assigned_to": {"eq": None}})
+    def test_fast_path_defers_errors_to_argparse(self):
+        self.assertIsNone(self.parser._parse_args_fast(["create task"]))
+        self.assertIsNone(self.parser._parse_args_fast(["delete task", "x"]))
+        self.assertIsNone(self.parser._parse_args_fast(["delete task", "-h"]))
+    
+    def test_fast_path_defers_unsupported_arguments(self):
+        @self.parser.command(argument("--ids", nargs="+", type=int), help="Export")
+        def export(args):
+            return "exported"
+        
+        self.assertIsNone(self.parser._parse_args_fast(["export", "--ids", "1"]))
+        self.assertEqual(self.parser.parse_args(["export", "--ids", "1"]).ids, [1])
+        
+        # Global actions the fast path doesn't implement
+        for action, argv, expected in (("count", ["-v", "version"], 1),
+                                       ("count", ["version"], None),
+                                       ("append", ["-v", "x", "version"], ["x"]),
+                                       ("append", ["version"], None)):
+            with self.subTest(action=action, argv=argv):
+                parser = CommandParserWrapper(prog="cloudtask")
+                parser.add_argument("-v", "--verbose", action=action)
+                
+                @parser.command(help="Version")
+                def version(args):
+                    return "version"
+                
+                self.assertIsNone(parser._parse_args_fast(argv))
+                self.assertEqual(parser.parse_args(argv).verbose, expected)
+    
+    def test_help_lists_unbuilt_commands(self):
+        help_text = self.parser.parser.format_help()
+        self.assertIn("create task", help_text)
+        self.assertIn("delete task", help_text)
+        self.assertEqual(self.parser.subparser_objs, [])
 
 
 class TestCache(unittest.TestCase):
     """Test the caching system"""
     
-    def setUp(self):
-        self.temp_file = tempfile.NamedTemporaryFile(delete=False)
-        self.temp_file.close()
-        self.cache = Cache(self.temp_file.name, timedelta(seconds=1))
+    # Short expiry used only where a test waits for an entry to go stale
+    TTL = timedelta(milliseconds=200)
     
-    def tearDown(self):
+    @classmethod
+    def setUpClass(cls):
+        # One temp file per class, truncated before each test
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            cls.path = f.name
+    
+    @classmethod
+    def tearDownClass(cls):
         try:
-            os.unlink(self.temp_file.name)
-        except:
+            os.unlink(cls.path)
+        except OSError:
             pass
     
+    def setUp(self):
+        open(self.path, 'wb').close()
+        self.cache = Cache(self.path, timedelta(minutes=1))
+    
     def test_cache_miss_when_empty(self):
         self.assertIsNone(self.cache.get())
     
@@ -100,15 +223,32 @@ class TestCache(unittest.TestCase):
         self.cache.set(data)
         self.assertEqual(self.cache.get(), data)
     
+    def test_cache_large_payload(self):
+        data = {"tasks": [{"id": i, "title": f"Task {i}"} for i in range(5000)]}
+        self.cache.set(data)
+        self.assertGreater(os.path.getsize(self.path), 64 * 1024)
+        self.assertEqual(self.cache.get(), data)
+    
+    def test_cache_rows_share_keys(self):
+        self.cache.set({"tasks": [{"status": "a"}, {"status": "b"}]})
+        first, second = self.cache.get()["tasks"]
+        self.assertIs(next(iter(first)), next(iter(second)))
+    
     def test_cache_expiration(self):
-        import time
+        cache = Cache(self.path, self.TTL)
         data = {"key": "value"}
-        self.cache.set(data)
+        cache.set(data)
         
         # Wait for cache to expire
-        time.sleep(1.5)
+        time.sleep(self.TTL.total_seconds() * 1.5 + 0.02)
         
-        self.assertIsNone(self.cache.get())
+        self.assertIsNone(cache.get())
+    
+    def test_cache_validators_survive_expiration(self):
+        cache = Cache(self.path, timedelta(0))
+        cache.set({"key": "value"}, etag='"abc"', last_modified="Mon")
+        self.assertIsNone(cache.get())
+        self.assertEqual(cache.get_with_validators(), ({"key": "value"}, '"abc"', "Mon"))
     
     def test_cache_clear(self):
         data = {"key": "value"}
@@ -120,17 +260,25 @@ class TestCache(unittest.TestCase):
 class TestConfig(unittest.TestCase):
     """Test configuration management"""
     
-    def setUp(self):
-        self.temp_file = tempfile.NamedTemporaryFile(delete=False, mode='w')
-        self.temp_file.close()
-        self.config = Config(self.temp_file.name)
+    @classmethod
+    def setUpClass(cls):
+        # One temp file per class, truncated before each test; kept in RAM
+        # where available since save() fsyncs
+        shm = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        with tempfile.NamedTemporaryFile(dir=shm, delete=False) as f:
+            cls.path = f.name
     
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         try:
-            os.unlink(self.temp_file.name)
-        except:
+            os.unlink(cls.path)
+        except OSError:
             pass
     
+    def setUp(self):
+        open(self.path, 'wb').close()
+        self.config = Config(self.path)
+    
     def test_get_with_default(self):
         value = self.config.get("nonexistent", "default")
         self.assertEqual(value, "default")
@@ -145,7 +293,7 @@ class TestConfig(unittest.TestCase):
         self.config.save()
         
         # Create new config instance with same file
-        new_config = Config(self.temp_file.name)
+        new_config = Config(self.path)
         self.assertEqual(new_config.get("key1"), "value1")
         self.assertEqual(new_config.get("key2"), 123)
     
@@ -153,74 +301,402 @@ class TestConfig(unittest.TestCase):
         self.config.set("key", "value")
         self.config.delete("key")
         self.assertIsNone(self.config.get("key"))
+    
+    def test_context_manager_saves_once_on_exit(self):
+        with patch('cloudtask._atomic_write', wraps=cloudtask._atomic_write) as write:
+            with Config(self.path) as config:
+                config.set("key1", "value1")
+                config.set("key2", 123)
+                self.assertEqual(write.call_count, 0)
+        self.assertEqual(write.call_count, 1)
+        self.assertEqual(Config(self.path).get("key2"), 123)
+    
+    def test_save_keeps_symlink_and_mode(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            target = os.path.join(tmp_dir, "dotfiles-config.json")
+            link = os.path.join(tmp_dir, "config.json")
+            with open(target, 'w') as f:
+                f.write("{}")
+            os.chmod(target, 0o644)
+            os.symlink(target, link)
+            
+            config = Config(link)
+            config.set("key", "value")
+            config.save()
+            
+            self.assertTrue(os.path.islink(link))
+            self.assertEqual(Config(target).get("key"), "value")
+            self.assertEqual(os.stat(target).st_mode & 0o777, 0o644)
+    
+    def test_context_manager_skips_unchanged_config(self):
+        with patch('cloudtask._atomic_write') as write:
+            with Config(self.path) as config:
+                config.get("key")
+        write.assert_not_called()
+
+
+class _StubSession:
+    """Stand-in for requests.Session that replays canned responses"""
+    
+    def __init__(self):
+        self.responses = []
+        self.calls = []
+        self.mounts = {}
+    
+    def mount(self, prefix, adapter):
+        self.mounts[prefix] = adapter
+    
+    def request(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.responses.pop(0)
+
+
+def _response(status_code=200, content=b'{}', headers=None, reason="OK"):
+    """Build a minimal response object"""
+    return SimpleNamespace(status_code=status_code, content=content,
+                           headers=headers or {}, reason=reason,
+                           raise_for_status=lambda: None)
 
 
+@unittest.skipIf(requests is None, "requests not available")
 class TestAPIClient(unittest.TestCase):
-    """Test the API client with mocked requests"""
+    """Test the API client with a stubbed requests session"""
     
-    @patch('cloudtask.requests.Session')
-    def test_get_request(self, mock_session_class):
-        # Setup mock
-        mock_session = MagicMock()
-        mock_session_class.return_value = mock_session
-        
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"result": "success"}
-        mock_response.content = b'{"result": "success"}'
-        mock_session.request.return_value = mock_response
+    def setUp(self):
+        self.session = _StubSession()
+        self._orig_session = cloudtask.requests.Session
+        cloudtask.requests.Session = lambda: self.session
+    
+    def tearDown(self):
+        cloudtask.requests.Session = self._orig_session
+    
+    def test_get_request(self):
+        self.session.responses = [_response(content=b'{"result": "success"}')]
         
-        # Test
         client = APIClient("https://api.example.com", "test_key")
         result = client.get("/tasks")
         
         self.assertEqual(result, {"result": "success"})
-        mock_session.request.assert_called_once()
+        self.assertEqual(len(self.session.calls), 1)
     
-    @patch('cloudtask.requests.Session')
-    def test_retry_on_rate_limit(self, mock_session_class):
-        # Setup mock
-        mock_session = MagicMock()
-        mock_session_class.return_value = mock_session
-        
+    def test_retry_on_rate_limit(self):
         # First call returns 429, second succeeds
-        mock_response_429 = Mock()
-        mock_response_429.status_code = 429
-        
-        mock_response_200 = Mock()
-        mock_response_200.status_code = 200
-        mock_response_200.json.return_value = {"result": "success"}
-        mock_response_200.content = b'{"result": "success"}'
-        
-        mock_session.request.side_effect = [mock_response_429, mock_response_200]
+        self.session.responses = [
+            _response(429),
+            _response(content=b'{"result": "success"}'),
+        ]
         
-        # Test
         client = APIClient("https://api.example.com", "test_key")
         result = client.get("/tasks")
         
         self.assertEqual(result, {"result": "success"})
-        self.assertEqual(mock_session.request.call_count, 2)
+        self.assertEqual(len(self.session.calls), 2)
     
-    @patch('cloudtask.requests.Session')
-    def test_authentication_header(self, mock_session_class):
-        # Setup mock
-        mock_session = MagicMock()
-        mock_session_class.return_value = mock_session
+    @patch('cloudtask.time.sleep')
+    def test_rate_limit_honors_retry_after(self, mock_sleep):
+        self.session.responses = [
+            _response(429, headers={"Retry-After": "2"}),
+            _response(),
+        ]
+        
+        client = APIClient("https://api.example.com", "test_key")
+        client.get("/tasks")
         
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {}
-        mock_response.content = b'{}'
-        mock_session.request.return_value = mock_response
+        mock_sleep.assert_called_once_with(2.0)
+    
+    def test_authentication_header(self):
+        self.session.responses = [_response()]
         
-        # Test
         client = APIClient("https://api.example.com", "secret_key_123")
         client.get("/tasks")
         
         # Verify Authorization header was set
-        call_args = mock_session.request.call_args
-        headers = call_args[1]['headers']
+        headers = self.session.calls[-1]['headers']
         self.assertEqual(headers['Authorization'], 'Bearer secret_key_123')
+    
+    def test_content_type_only_with_body(self):
+        self.session.responses = [_response(), _response()]
+        
+        client = APIClient("https://api.example.com", "test_key")
+        client.get("/tasks")
+        self.assertNotIn('Content-Type', self.session.calls[-1]['headers'])
+        
+        client.post("/tasks", {"title": "x"})
+        headers = self.session.calls[-1]['headers']
+        self.assertEqual(headers['Content-Type'], 'application/json')
+        self.assertEqual(headers['Accept'], 'application/json')
+    
+    def test_conditional_get_uses_cached_response(self):
+        self.session.responses = [
+            _response(content=b'{"tasks": [1, 2]}', headers={"ETag": '"v1"'}),
+            _response(304, content=b''),
+        ]
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client = APIClient("https://api.example.com", cache_dir=cache_dir)
+            self.assertEqual(client.get("/tasks"), {"tasks": [1, 2]})
+            self.assertEqual(client.get("/tasks"), {"tasks": [1, 2]})
+        
+        # The default duration revalidates on every GET
+        self.assertEqual(len(self.session.calls), 2)
+        headers = self.session.calls[-1]['headers']
+        self.assertEqual(headers['If-None-Match'], '"v1"')
+    
+    def test_cached_response_reflects_server_change(self):
+        self.session.responses = [
+            _response(content=b'{"v": 1}', headers={"ETag": '"v1"'}),
+            _response(content=b'{"v": 2}', headers={"ETag": '"v2"'}),
+        ]
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client = APIClient("https://api.example.com", cache_dir=cache_dir)
+            self.assertEqual(client.get("/tasks"), {"v": 1})
+            self.assertEqual(client.get("/tasks"), {"v": 2})
+    
+    def test_cache_not_shared_between_api_keys(self):
+        self.session.responses = [
+            _response(content=b'{"who": "alice"}', headers={"ETag": '"a"'}),
+            _response(content=b'{"who": "bob"}', headers={"ETag": '"b"'}),
+        ]
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            ttl = timedelta(minutes=15)
+            alice = APIClient("https://api.example.com", "alice",
+                              cache_dir=cache_dir, cache_duration=ttl)
+            bob = APIClient("https://api.example.com", "bob",
+                            cache_dir=cache_dir, cache_duration=ttl)
+            self.assertEqual(alice.get("/tasks"), {"who": "alice"})
+            self.assertEqual(bob.get("/tasks"), {"who": "bob"})
+        
+        self.assertNotIn('If-None-Match', self.session.calls[-1]['headers'])
+    
+    def test_opt_in_duration_serves_fresh_entry(self):
+        self.session.responses = [_response(content=b'{"v": 1}')]
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client = APIClient("https://api.example.com", cache_dir=cache_dir,
+                               cache_duration=timedelta(minutes=15))
+            self.assertEqual(client.get("/tasks"), {"v": 1})
+            self.assertEqual(client.get("/tasks"), {"v": 1})
+        
+        self.assertEqual(len(self.session.calls), 1)
+    
+    def test_write_invalidates_cached_endpoint(self):
+        self.session.responses = [
+            _response(content=b'{"v": 1}', headers={"ETag": '"v1"'}),
+            _response(content=b'{}'),
+            _response(content=b'{"v": 2}'),
+        ]
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client = APIClient("https://api.example.com", cache_dir=cache_dir,
+                               cache_duration=timedelta(minutes=15))
+            self.assertEqual(client.get("/tasks"), {"v": 1})
+            client.put("/tasks/1", {"status": "done"})
+            self.assertEqual(client.get("/tasks"), {"v": 2})
+        
+        self.assertNotIn('If-None-Match', self.session.calls[-1]['headers'])
+    
+    def test_read_only_post_keeps_cache(self):
+        self.session.responses = [
+            _response(content=b'{"v": 1}'),
+            _response(content=b'{"tasks": []}'),
+        ]
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client = APIClient("https://api.example.com", cache_dir=cache_dir,
+                               cache_duration=timedelta(minutes=15))
+            client.get("/tasks")
+            client.post("/tasks/search", {}, invalidate=False)
+            self.assertEqual(client.get("/tasks"), {"v": 1})
+        
+        self.assertEqual(len(self.session.calls), 2)
+    
+    def test_connection_pool_mounted(self):
+        APIClient("https://api.example.com", pool_size=16)
+        
+        self.assertEqual(sorted(self.session.mounts), ["http://", "https://"])
+        self.assertEqual(self.session.mounts["https://"]._pool_maxsize, 16)
+    
+    def test_client_error_not_retried(self):
+        self.session.responses = [_response(404, reason="Not Found")]
+        
+        client = APIClient("https://api.example.com", "test_key")
+        with self.assertRaises(CloudTaskException) as ctx:
+            client.get("/tasks/999")
+        
+        self.assertEqual(ctx.exception.status_code, 404)
+        self.assertEqual(len(self.session.calls), 1)
+
+
+@unittest.skipIf(httpx is None, "httpx not available")
+class TestAsyncAPIClient(unittest.TestCase):
+    """Test the async API client with an httpx mock transport"""
+    
+    def _put(self, responses, **kwargs):
+        """PUT /tasks/1 against canned responses, returning (result, requests)"""
+        import asyncio
+        
+        requests_seen = []
+        
+        def handler(request):
+            requests_seen.append(request)
+            return responses.pop(0)
+        
+        async def main():
+            async with AsyncAPIClient("https://api.example.com", "test_key",
+                                      transport=httpx.MockTransport(handler),
+                                      **kwargs) as client:
+                return await client.put("/tasks/1", {"status": "done"})
+        
+        return asyncio.run(main()), requests_seen
+    
+    def test_put_request(self):
+        result, seen = self._put([httpx.Response(200, json={"result": "success"})])
+        
+        self.assertEqual(result, {"result": "success"})
+        self.assertEqual(len(seen), 1)
+        self.assertEqual(seen[0].headers["Authorization"], "Bearer test_key")
+        self.assertEqual(seen[0].headers["Content-Type"], "application/json")
+    
+    def test_put_invalidates_response_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cached = APIClient._endpoint_cache_dir(cache_dir, "https://api.example.com",
+                                                   "/tasks")
+            os.makedirs(cached)
+            self._put([httpx.Response(200, json={})], cache_dir=cache_dir)
+            self.assertFalse(os.path.exists(cached))
+    
+    def test_retry_on_rate_limit(self):
+        result, seen = self._put([
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"result": "success"}),
+        ])
+        
+        self.assertEqual(result, {"result": "success"})
+        self.assertEqual(len(seen), 2)
+    
+    def test_client_error_not_retried(self):
+        responses = [httpx.Response(404), httpx.Response(200)]
+        with self.assertRaisesRegex(CloudTaskException, "404 Not Found") as ctx:
+            self._put(responses)
+        
+        self.assertEqual(ctx.exception.status_code, 404)
+        self.assertEqual(len(responses), 1)
+    
+    def test_falls_back_without_http2(self):
+        real_client = httpx.AsyncClient
+        created = []
+        
+        def async_client(**kwargs):
+            if kwargs.get("http2"):
+                raise ImportError("h2 not installed")
+            created.append(kwargs)
+            return real_client(**kwargs)
+        
+        with patch.object(httpx, "AsyncClient", side_effect=async_client):
+            result, _ = self._put([httpx.Response(200, json={})])
+        
+        self.assertEqual(result, {})
+        self.assertEqual(len(created), 1)
+
+
+class TestUpdateTasksCommand(unittest.TestCase):
+    """Test the batch update command"""
+    
+    def _run(self, client, task_ids, use_async=False):
+        import argparse
+        args = argparse.Namespace(task_ids=task_ids, status="done", priority=None,
+                                  explain=False, no_async=False,
+                                  url="https://api.example.com", api_key="test_key")
+        with patch('cloudtask.get_api_client', return_value=client), \
+             patch('builtins.print') as mock_print:
+            if use_async:
+                cloudtask.update__tasks(args)
+            else:
+                with patch('cloudtask._lazy_httpx', return_value=None):
+                    cloudtask.update__tasks(args)
+        return sorted(c[0][0] for c in mock_print.call_args_list)
+    
+    def test_bulk_update_single_request(self):
+        client = Mock()
+        output = self._run(client, [1, 2, 3])
+        
+        client.post.assert_called_once_with(
+            "/tasks/bulk_update", {"ids": [1, 2, 3], "updates": {"status": "done"}}
+        )
+        client.put.assert_not_called()
+        self.assertEqual(output, ["Task 1: Success", "Task 2: Success", "Task 3: Success"])
+    
+    def test_bulk_update_reports_failed_ids(self):
+        client = Mock()
+        client.post.return_value = {"results": [
+            {"id": 1, "success": True},
+            {"id": 2, "error": "not found"},
+        ]}
+        output = self._run(client, [1, 2, 3])
+        
+        self.assertEqual(output, [
+            "Task 1: Success",
+            "Task 2: Error - not found",
+            "Task 3: Error - missing from bulk update response",
+        ])
+    
+    def test_bulk_update_checks_updated_ids(self):
+        client = Mock()
+        client.post.return_value = {"updated": [1, 3]}
+        output = self._run(client, [1, 2, 3])
+        
+        self.assertEqual(output, ["Task 1: Success", "Task 2: Error - not updated",
+                                  "Task 3: Success"])
+    
+    def test_falls_back_without_bulk_endpoint(self):
+        client = Mock()
+        client.post.side_effect = CloudTaskException("not found", status_code=404)
+        output = self._run(client, [1, 2])
+        
+        self.assertEqual(client.put.call_count, 2)
+        self.assertEqual(output, ["Task 1: Success", "Task 2: Success"])
+    
+    @unittest.skipIf(httpx is None, "httpx not available")
+    def test_fallback_uses_async_client(self):
+        paths = []
+        
+        def handler(request):
+            paths.append(request.url.path)
+            return httpx.Response(200, json={})
+        
+        client = Mock(cache_dir=None)
+        client.post.side_effect = CloudTaskException("not found", status_code=404)
+        async_client = functools.partial(AsyncAPIClient,
+                                         transport=httpx.MockTransport(handler))
+        with patch('cloudtask.AsyncAPIClient', async_client):
+            output = self._run(client, [1, 2], use_async=True)
+        
+        client.put.assert_not_called()
+        self.assertCountEqual(paths, ["/tasks/1", "/tasks/2"])
+        self.assertEqual(output, ["Task 1: Success", "Task 2: Success"])
+
+
+class TestSetApiKeyCommand(unittest.TestCase):
+    """Test saving the API key"""
+    
+    def test_existing_key_file_made_private(self):
+        import argparse
+        with tempfile.TemporaryDirectory() as config_dir:
+            key_file = os.path.join(config_dir, "api_key")
+            with open(key_file, 'w') as f:
+                f.write("OLDKEY")
+            os.chmod(key_file, 0o644)
+            
+            with patch.dict(cloudtask.DIRS, {'config': config_dir}), \
+                 patch('cloudtask.API_KEY_FILE', key_file), \
+                 patch('builtins.print'):
+                cloudtask.set__api_key(argparse.Namespace(key="NEWKEY"))
+            
+            self.assertEqual(os.stat(key_file).st_mode & 0o777, 0o600)
+            with open(key_file) as f:
+                self.assertEqual(f.read(), "NEWKEY")
 
 
 class TestConcurrentExecution(unittest.TestCase):
@@ -234,7 +710,71 @@ class TestConcurrentExecution(unittest.TestCase):
         results = execute_concurrent(square, items, max_workers=2)
         
         expected = [1, 4, 9, 16, 25]
-        self.assertEqual(sorted(results), sorted(expected))
+        self.assertCountEqual(results, expected)
+    
+    def test_single_worker_runs_inline(self):
+        threads = set()
+        
+        def record(x):
+            threads.add(threading.get_ident())
+            return x
+        
+        execute_concurrent(record, [1, 2, 3], max_workers=1)
+        self.assertEqual(threads, {threading.get_ident()})
+    
+    def test_concurrent_bounded_window(self):
+        lock = threading.Lock()
+        submitted = []
+        finished = []
+        peak = [0]
+        
+        def items():
+            for x in range(20):
+                # Pulled from the iterator only when submitted to the pool
+                with lock:
+                    submitted.append(x)
+                    peak[0] = max(peak[0], len(submitted) - len(finished))
+                yield x
+        
+        def work(x):
+            time.sleep(0.001)
+            with lock:
+                finished.append(x)
+            return x + 1
+        
+        results = execute_concurrent(work, items(), max_workers=2, inflight=3)
+        self.assertCountEqual(results, list(range(1, 21)))
+        self.assertLessEqual(peak[0], 3)
+    
+    def test_thread_pool_reused_across_calls(self):
+        self.assertIs(cloudtask._get_thread_pool(2), cloudtask._get_thread_pool(2))
+        
+        # Thread objects, not idents: idents are recycled across fresh pools
+        threads = set()
+        
+        def record(x):
+            threads.add(threading.current_thread())
+            return x
+        
+        execute_concurrent(record, [1, 2, 3], max_workers=2)
+        execute_concurrent(record, [4, 5, 6], max_workers=2)
+        self.assertLessEqual(len(threads), 2)
+    
+    def test_nested_calls_do_not_deadlock(self):
+        def inner_batch(x):
+            return sum(execute_concurrent(lambda y: y + x, [1, 2], max_workers=2))
+        
+        outcome = []
+        runner = threading.Thread(
+            target=lambda: outcome.append(execute_concurrent(inner_batch, [10, 20],
+                                                             max_workers=2)),
+            daemon=True
+        )
+        runner.start()
+        runner.join(timeout=5)
+        
+        self.assertFalse(runner.is_alive(), "nested execute_concurrent deadlocked")
+        self.assertCountEqual(outcome[0], [23, 43])
     
     def test_concurrent_with_retry(self):
         call_counts = {}
@@ -253,7 +793,34 @@ class TestConcurrentExecution(unittest.TestCase):
         results = execute_concurrent(flaky_function, items, max_workers=2, max_retries=5)
         
         expected = [2, 4, 6]
-        self.assertEqual(sorted(results), sorted(expected))
+        self.assertCountEqual(results, expected)
+
+
+class TestAsyncExecution(unittest.TestCase):
+    """Test asyncio batch execution"""
+    
+    def test_async_execution(self):
+        import asyncio
+        
+        async def square(x):
+            await asyncio.sleep(0)
+            return x * x
+        
+        results = asyncio.run(execute_async(square, [1, 2, 3, 4], concurrency=2))
+        self.assertCountEqual(results, [1, 4, 9, 16])
+    
+    def test_async_with_retry(self):
+        import asyncio
+        call_counts = {}
+        
+        async def flaky_function(x):
+            call_counts[x] = call_counts.get(x, 0) + 1
+            if call_counts[x] < 2:
+                raise ValueError("Simulated failure")
+            return x * 2
+        
+        results = asyncio.run(execute_async(flaky_function, [1, 2, 3], max_retries=3))
+        self.assertCountEqual(results, [2, 4, 6])
 
 
 class TestUtilityFunctions(unittest.TestCase):
@@ -265,6 +832,30 @@ class TestUtilityFunctions(unittest.TestCase):
         self.assertIn("2024", result)
         self.assertIn("01", result)
     
+    def test_display_table_alignment(self):
+        import io
+        from contextlib import redirect_stdout
+        
+        fields = (
+            ("name", "Name", "{}", None, True),
+            ("count", "Count", "{}", None, False),
+        )
+        out = io.StringIO()
+        with redirect_stdout(out):
+            display_table([{"name": "a b", "count": 7}, {"name": "c"}], fields)
+        
+        self.assertEqual(out.getvalue().splitlines(), [
+            "Name  Count",
+            "a_b       7",
+            "c         -",
+        ])
+    
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("3"), 3.0)
+        self.assertEqual(parse_retry_after("Thu, 01 Jan 1970 00:00:00 GMT"), 0.0)
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after(None))
+    
     def test_deindent(self):
         text = """
             Line 1